@@ -23,3 +23,12 @@ SUPABASE_SERVICE_ROLE_KEY = env_get("SUPABASE_SERVICE_ROLE_KEY")
 # --- RAG ---
 RAG_MATCH_FN = os.environ.get("RAG_MATCH_FN", "match_chunks")
 EMBEDDING_MODEL_NAME = os.environ.get("EMBEDDING_MODEL_NAME", "text-embedding-004")
+
+# --- Hybrid retrieval (BM25 + vector, fused with reciprocal-rank fusion) ---
+RAG_CHUNKS_TABLE = os.environ.get("RAG_CHUNKS_TABLE", "chunks")
+RAG_RRF_K = int(os.environ.get("RAG_RRF_K", "60"))
+RAG_HYBRID_CANDIDATES = int(os.environ.get("RAG_HYBRID_CANDIDATES", "20"))
+RAG_LEXICAL_MAX_TERMS = int(os.environ.get("RAG_LEXICAL_MAX_TERMS", "32"))
+# Seconds between lexical index re-snapshots, and before retrying a failed load
+RAG_LEXICAL_REFRESH_SEC = int(os.environ.get("RAG_LEXICAL_REFRESH_SEC", "900"))
+RAG_LEXICAL_RETRY_SEC = int(os.environ.get("RAG_LEXICAL_RETRY_SEC", "60"))
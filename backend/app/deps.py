@@ -1,4 +1,8 @@
 # backend/app/deps.py
+import logging
+import threading
+import time
+
 import vertexai
 from vertexai.language_models import TextEmbeddingModel
 from supabase import create_client
@@ -9,7 +13,13 @@ from .config import (
     SUPABASE_URL,
     SUPABASE_SERVICE_ROLE_KEY,
     EMBEDDING_MODEL_NAME,
+    RAG_CHUNKS_TABLE,
+    RAG_LEXICAL_REFRESH_SEC,
+    RAG_LEXICAL_RETRY_SEC,
 )
+from .services.lexical_index import BM25Index, load_snapshot
+
+logger = logging.getLogger(__name__)
 
 # Initialize Vertex AI once (module import time)
 vertexai.init(project=GOOGLE_CLOUD_PROJECT, location=VERTEX_LOCATION)
@@ -18,6 +28,12 @@ _embedding_model = TextEmbeddingModel.from_pretrained(EMBEDDING_MODEL_NAME)
 # Initialize Supabase once
 _supabase = create_client(SUPABASE_URL, SUPABASE_SERVICE_ROLE_KEY)
 
+# Lexical index is built off the request path by a background thread; until
+# the first snapshot lands, retrieval serves vector-only.
+_lexical_index = None
+_lexical_thread = None
+_lexical_lock = threading.Lock()
+
 
 def get_embedding_model() -> TextEmbeddingModel:
     return _embedding_model
@@ -25,3 +41,38 @@ def get_embedding_model() -> TextEmbeddingModel:
 
 def get_supabase():
     return _supabase
+
+
+def get_lexical_index():
+    """Return the shared BM25 index, or None if it isn't built yet."""
+    return _lexical_index
+
+
+def refresh_lexical_index() -> bool:
+    """Re-snapshot the chunk table and swap in a freshly built index."""
+    global _lexical_index
+    try:
+        index = BM25Index.from_rows(load_snapshot(_supabase, RAG_CHUNKS_TABLE))
+    except Exception as e:
+        logger.warning("Lexical index refresh failed: %s", e)
+        return False
+    _lexical_index = index
+    logger.info("Lexical index refreshed with %d chunks", len(index))
+    return True
+
+
+def _lexical_refresh_loop() -> None:
+    while True:
+        ok = refresh_lexical_index()
+        time.sleep(RAG_LEXICAL_REFRESH_SEC if ok else RAG_LEXICAL_RETRY_SEC)
+
+
+def start_lexical_index_refresh() -> None:
+    """Start the background build/refresh thread (idempotent)."""
+    global _lexical_thread
+    with _lexical_lock:
+        if _lexical_thread is None:
+            _lexical_thread = threading.Thread(
+                target=_lexical_refresh_loop, name="lexical-index", daemon=True
+            )
+            _lexical_thread.start()
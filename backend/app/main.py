@@ -1,3 +1,5 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
@@ -9,8 +11,17 @@ from app.routes.pitch_sessions import pitch_router as pitch_router
 from app.routes.rag import router as rag_router
 from app.routes.feedback import router as feedback_router
 from app.routes.user_data import router as user_data_router
+from app.deps import start_lexical_index_refresh
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Build the BM25 index in the background so cold starts don't block on it
+    start_lexical_index_refresh()
+    yield
+
 
-app = FastAPI(title="DemoDay AI Backend", version="0.1.0")
+app = FastAPI(title="DemoDay AI Backend", version="0.1.0", lifespan=lifespan)
 
 # Configure CORS
 app.add_middleware(
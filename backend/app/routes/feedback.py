@@ -4,7 +4,8 @@ from typing import Optional, List, Dict, Any
 from sqlalchemy.orm import Session
 from datetime import datetime
 
-from ..deps import get_supabase, get_embedding_model
+from ..config import RAG_RRF_K
+from ..deps import get_supabase, get_embedding_model, get_lexical_index
 from ..services.rag_service import retrieve_contexts
 from ..services.feedback_service import generate_feedback
 
@@ -17,6 +18,11 @@ router = APIRouter(prefix="/pitch", tags=["pitch"])
 class FeedbackReq(BaseModel):
     pitch_text: str = Field(..., min_length=20)
     top_k: int = Field(6, ge=1, le=20)
+    # hybrid retrieval is opt-in here: the query is the whole pitch, which
+    # suits dense similarity better than keyword matching
+    vector_weight: float = Field(1.0, ge=0)
+    lexical_weight: float = Field(0.0, ge=0)
+    rrf_k: int = Field(RAG_RRF_K, ge=1)
     # optional: include live Q&A transcript later
     qa_transcript: Optional[List[Dict[str, Any]]] = None
     # optional: id of the pitch session created earlier so we can update
@@ -33,6 +39,10 @@ def pitch_feedback(req: FeedbackReq, db: Session = Depends(get_db)):
         query=req.pitch_text,
         top_k=req.top_k,
         filter_video_id=None,
+        lexical_index=get_lexical_index(),
+        vector_weight=req.vector_weight,
+        lexical_weight=req.lexical_weight,
+        rrf_k=req.rrf_k,
     )
 
     # generate structured feedback JSON from model
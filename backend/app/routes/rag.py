@@ -2,7 +2,8 @@
 from fastapi import APIRouter
 from pydantic import BaseModel, Field
 
-from ..deps import get_embedding_model, get_supabase
+from ..config import RAG_RRF_K
+from ..deps import get_embedding_model, get_lexical_index, get_supabase
 from ..services.rag_service import retrieve_contexts
 
 router = APIRouter(prefix="/rag", tags=["rag"])
@@ -11,6 +12,10 @@ router = APIRouter(prefix="/rag", tags=["rag"])
 class RetrieveReq(BaseModel):
     query: str = Field(..., min_length=1)
     top_k: int = Field(5, ge=1, le=20)
+    # reciprocal-rank fusion weights; lexical_weight=0 means vector-only
+    vector_weight: float = Field(1.0, ge=0)
+    lexical_weight: float = Field(1.0, ge=0)
+    rrf_k: int = Field(RAG_RRF_K, ge=1)
 
 
 @router.post("/retrieve")
@@ -21,4 +26,8 @@ def rag_retrieve(req: RetrieveReq):
         query=req.query,
         top_k=req.top_k,
         filter_video_id=None,
+        lexical_index=get_lexical_index(),
+        vector_weight=req.vector_weight,
+        lexical_weight=req.lexical_weight,
+        rrf_k=req.rrf_k,
     )
@@ -0,0 +1,246 @@
+# backend/app/services/lexical_index.py
+import logging
+import math
+import re
+import threading
+from array import array
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Kept deliberately small: domain words like "seed", "round" or "arr" must
+# stay searchable, only pure glue words are dropped.
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from has have i in is it its of on or so "
+    "that the this to was we were will with you your".split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    return [t for t in _TOKEN_RE.findall((text or "").lower()) if t not in _STOPWORDS]
+
+
+def chunk_key(row: Dict[str, Any], by_id: bool = True) -> Hashable:
+    # Prefer the chunk primary key; fall back to (video, exact start offset)
+    # for rows that don't carry one. start_sec is never truncated so two
+    # chunks starting within the same second stay distinct.
+    if by_id and row.get("id") is not None:
+        return row["id"]
+    return (row["video_id"], float(row["start_sec"]))
+
+
+class BM25Index:
+    """In-process BM25 inverted index over transcript chunks.
+
+    Postings are stored per term as parallel ``array`` buffers of doc ids and
+    term frequencies, so the index stays compact and new documents are only
+    ever appended. Replacing or removing a chunk tombstones its old doc id;
+    ``compact()`` rewrites the postings once tombstones pile up.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self._lock = threading.RLock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._term_ids: Dict[str, int] = {}
+        self._post_docs: List[array] = []
+        self._post_tfs: List[array] = []
+        self._df = array("I")
+        self._doc_len = array("I")
+        self._alive = bytearray()
+        self._docs: List[Optional[Dict[str, Any]]] = []
+        self._key_to_doc: Dict[Hashable, int] = {}
+        self._total_len = 0
+        self._n_alive = 0
+
+    def __len__(self) -> int:
+        return self._n_alive
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Dict[str, Any]], **kwargs) -> "BM25Index":
+        index = cls(**kwargs)
+        index.add_documents(rows)
+        return index
+
+    # --- updates ---
+
+    def add_documents(self, rows: Iterable[Dict[str, Any]]) -> int:
+        """Insert or replace chunks; returns how many malformed rows were skipped."""
+        skipped = 0
+        with self._lock:
+            for row in rows:
+                try:
+                    self._add(row)
+                except (KeyError, TypeError, ValueError):
+                    skipped += 1
+        if skipped:
+            logger.warning("Skipped %d malformed chunk rows in lexical index", skipped)
+        return skipped
+
+    def remove_document(self, key: Hashable) -> bool:
+        """Remove a chunk by its ``chunk_key``."""
+        with self._lock:
+            doc_id = self._key_to_doc.pop(key, None)
+            if doc_id is None:
+                return False
+            self._tombstone(doc_id)
+            return True
+
+    def _add(self, row: Dict[str, Any]) -> None:
+        # Validate everything before touching the index so a bad row
+        # can't leave it half-updated.
+        key = chunk_key(row)
+        text = row["text"]
+        if not isinstance(text, str):
+            raise TypeError("chunk text must be a string")
+        doc = {
+            "id": row.get("id"),
+            "text": text,
+            "title": row.get("title"),
+            "video_id": row["video_id"],
+            "start_sec": float(row["start_sec"]),
+            "end_sec": int(row["end_sec"]),
+        }
+
+        old = self._key_to_doc.get(key)
+        if old is not None:
+            self._tombstone(old)
+
+        doc_id = len(self._docs)
+        tokens = tokenize(text)
+        tfs: Dict[str, int] = {}
+        for tok in tokens:
+            tfs[tok] = tfs.get(tok, 0) + 1
+
+        for term, tf in tfs.items():
+            tid = self._term_ids.get(term)
+            if tid is None:
+                tid = len(self._post_docs)
+                self._term_ids[term] = tid
+                self._post_docs.append(array("I"))
+                self._post_tfs.append(array("I"))
+                self._df.append(0)
+            self._post_docs[tid].append(doc_id)
+            self._post_tfs[tid].append(tf)
+            self._df[tid] += 1
+
+        doc["_terms"] = tuple(tfs)
+        self._docs.append(doc)
+        self._doc_len.append(len(tokens))
+        self._alive.append(1)
+        self._key_to_doc[key] = doc_id
+        self._total_len += len(tokens)
+        self._n_alive += 1
+
+    def _tombstone(self, doc_id: int) -> None:
+        if not self._alive[doc_id]:
+            return
+        self._alive[doc_id] = 0
+        for term in self._docs[doc_id]["_terms"]:
+            self._df[self._term_ids[term]] -= 1
+        self._docs[doc_id] = None
+        self._total_len -= self._doc_len[doc_id]
+        self._n_alive -= 1
+
+    def compact(self) -> None:
+        """Drop tombstoned doc ids from the postings by re-adding live docs."""
+        with self._lock:
+            live = [d for d in self._docs if d is not None]
+            self._reset()
+            for doc in live:
+                self._add(doc)
+
+    # --- search ---
+
+    def search(
+        self,
+        query: str,
+        top_k: int = 20,
+        filter_video_id: Optional[str] = None,
+        max_terms: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Rank chunks by BM25.
+
+        ``max_terms`` keeps only the highest-IDF query terms, which bounds the
+        cost of long queries such as a whole pitch.
+        """
+        with self._lock:
+            n = self._n_alive
+            if n == 0:
+                return []
+            avgdl = self._total_len / n
+            k1, b = self.k1, self.b
+
+            terms = []
+            for term in set(tokenize(query)):
+                tid = self._term_ids.get(term)
+                if tid is None or self._df[tid] == 0:
+                    continue
+                df = self._df[tid]
+                terms.append((math.log(1.0 + (n - df + 0.5) / (df + 0.5)), tid))
+            if max_terms is not None:
+                terms = sorted(terms, reverse=True)[:max_terms]
+
+            scores: Dict[int, float] = {}
+            for idf, tid in terms:
+                docs, tfs = self._post_docs[tid], self._post_tfs[tid]
+                for i in range(len(docs)):
+                    doc_id = docs[i]
+                    if not self._alive[doc_id]:
+                        continue
+                    tf = tfs[i]
+                    norm = k1 * (1.0 - b + b * self._doc_len[doc_id] / avgdl)
+                    scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (k1 + 1.0) / (tf + norm)
+
+            if filter_video_id is not None:
+                scores = {
+                    d: s for d, s in scores.items() if self._docs[d]["video_id"] == filter_video_id
+                }
+
+            ranked = sorted(scores.items(), key=lambda kv: kv[1], reverse=True)[:top_k]
+            results = []
+            for doc_id, score in ranked:
+                doc = self._docs[doc_id]
+                hit = {k: v for k, v in doc.items() if k != "_terms"}
+                hit["bm25_score"] = score
+                results.append(hit)
+            return results
+
+
+def load_snapshot(supabase, table: str, page_size: int = 1000) -> List[Dict[str, Any]]:
+    rows: List[Dict[str, Any]] = []
+    start = 0
+    while True:
+        res = (
+            supabase.table(table)
+            .select("id,video_id,title,start_sec,end_sec,text")
+            .order("id")
+            .range(start, start + page_size - 1)
+            .execute()
+        )
+        page = res.data or []
+        rows.extend(page)
+        if len(page) < page_size:
+            return rows
+        start += page_size
+
+
+def reciprocal_rank_fusion(
+    ranked_lists: List[Tuple[List[Dict[str, Any]], float]],
+    k: int = 60,
+    by_id: bool = True,
+) -> List[Tuple[Hashable, float]]:
+    """Fuse ranked result lists with weighted RRF: sum(w / (k + rank))."""
+    fused: Dict[Hashable, float] = {}
+    for rows, weight in ranked_lists:
+        if weight <= 0:
+            continue
+        for rank, row in enumerate(rows, start=1):
+            key = chunk_key(row, by_id=by_id)
+            fused[key] = fused.get(key, 0.0) + weight / (k + rank)
+    return sorted(fused.items(), key=lambda kv: kv[1], reverse=True)
@@ -1,8 +1,9 @@
 # backend/app/services/rag_service.py
 from typing import Any, Dict, Optional
 
-from ..config import RAG_MATCH_FN
+from ..config import RAG_HYBRID_CANDIDATES, RAG_LEXICAL_MAX_TERMS, RAG_MATCH_FN, RAG_RRF_K
 from ..utils.youtube import youtube_timestamp_url
+from .lexical_index import chunk_key, reciprocal_rank_fusion
 
 
 def retrieve_contexts(
@@ -12,7 +13,15 @@ def retrieve_contexts(
     query: str,
     top_k: int = 5,
     filter_video_id: Optional[str] = None,
+    lexical_index=None,
+    vector_weight: float = 1.0,
+    lexical_weight: float = 1.0,
+    rrf_k: int = RAG_RRF_K,
 ) -> Dict[str, Any]:
+    hybrid = lexical_index is not None and lexical_weight > 0
+    # Fusion needs a deeper candidate pool than what ends up in the prompt
+    pool = max(top_k, RAG_HYBRID_CANDIDATES) if hybrid else top_k
+
     # 1) Embed query
     qvec = embedding_model.get_embeddings([query])[0].values
 
@@ -21,14 +30,45 @@ def retrieve_contexts(
         RAG_MATCH_FN,
         {
             "query_embedding": qvec,
-            "match_count": top_k,
+            "match_count": pool,
             "filter_video_id": filter_video_id,
         },
     ).execute()
+    vector_rows = res.data or []
+
+    # 3) Lexical (BM25) search + reciprocal-rank fusion
+    if hybrid:
+        lexical_rows = lexical_index.search(
+            query,
+            top_k=pool,
+            filter_video_id=filter_video_id,
+            max_terms=RAG_LEXICAL_MAX_TERMS,
+        )
+        # Join on the chunk id only if match_chunks returns one; otherwise
+        # both lists fall back to (video_id, start_sec).
+        by_id = all(row.get("id") is not None for row in vector_rows)
+        by_key: Dict[Any, Dict[str, Any]] = {}
+        for row in lexical_rows:
+            by_key[chunk_key(row, by_id=by_id)] = dict(row)
+        for row in vector_rows:
+            by_key.setdefault(chunk_key(row, by_id=by_id), {}).update(row)
+
+        fused = reciprocal_rank_fusion(
+            [(vector_rows, vector_weight), (lexical_rows, lexical_weight)],
+            k=rrf_k,
+            by_id=by_id,
+        )
+        rows = []
+        for key, score in fused[:top_k]:
+            row = by_key[key]
+            row["rrf_score"] = score
+            rows.append(row)
+    else:
+        rows = vector_rows[:top_k]
 
-    # 3) Format contexts with citations
+    # 4) Format contexts with citations
     contexts = []
-    for row in (res.data or []):
+    for row in rows:
         video_id = row["video_id"]
         start_sec = int(row["start_sec"])
         contexts.append(
@@ -39,8 +79,10 @@ def retrieve_contexts(
                 "start_sec": start_sec,
                 "end_sec": int(row["end_sec"]),
                 "similarity": row.get("similarity"),
+                "bm25_score": row.get("bm25_score"),
+                "rrf_score": row.get("rrf_score"),
                 "youtube_url": youtube_timestamp_url(video_id, start_sec),
             }
         )
 
-    return {"query": query, "contexts": contexts}
+    return {"query": query, "mode": "hybrid" if hybrid else "vector", "contexts": contexts}
@@ -0,0 +1,105 @@
+import pytest
+
+from app.services.lexical_index import BM25Index, chunk_key, reciprocal_rank_fusion
+
+
+def _row(id, video_id, start_sec, text):
+    return {
+        "id": id,
+        "video_id": video_id,
+        "title": None,
+        "start_sec": start_sec,
+        "end_sec": start_sec + 30,
+        "text": text,
+    }
+
+
+ROWS = [
+    _row(1, "v1", 0, "we raised a seed round from top investors"),
+    _row(2, "v1", 30, "our ARR is two million and growing fast"),
+    _row(3, "v2", 0, "the market for developer tools is huge"),
+    _row(4, "v2", 30, "ARR matters more than a seed round"),
+]
+
+
+def _ids(hits):
+    return [h["id"] for h in hits]
+
+
+def test_search_ranks_exact_terms():
+    index = BM25Index.from_rows(ROWS)
+    assert sorted(_ids(index.search("ARR"))) == [2, 4]
+    assert sorted(_ids(index.search("seed round"))) == [1, 4]
+    assert index.search("unrelated words") == []
+
+
+def test_upsert_replaces_old_doc():
+    index = BM25Index.from_rows(ROWS)
+    index.add_documents([_row(2, "v1", 30, "churn went down this quarter")])
+    assert len(index) == 4
+    assert _ids(index.search("ARR")) == [4]
+    assert _ids(index.search("churn")) == [2]
+
+
+def test_remove_document():
+    index = BM25Index.from_rows(ROWS)
+    assert index.remove_document(3)
+    assert not index.remove_document(3)
+    assert len(index) == 3
+    assert index.search("market") == []
+
+
+def test_compact_keeps_scores():
+    index = BM25Index.from_rows(ROWS)
+    index.add_documents([_row(1, "v1", 0, "we raised a pre-seed round")])
+    index.remove_document(3)
+    before = index.search("seed round ARR")
+    index.compact()
+    after = index.search("seed round ARR")
+    assert _ids(before) == _ids(after)
+    for b, a in zip(before, after):
+        assert a["bm25_score"] == pytest.approx(b["bm25_score"])
+
+
+def test_filter_video_id():
+    index = BM25Index.from_rows(ROWS)
+    assert _ids(index.search("ARR", filter_video_id="v2")) == [4]
+    assert index.search("market", filter_video_id="v1") == []
+
+
+def test_max_terms_keeps_rarest_terms():
+    index = BM25Index.from_rows(ROWS)
+    # "market" appears once, "arr" twice; capping to one term keeps "market"
+    assert _ids(index.search("ARR market", max_terms=1)) == [3]
+
+
+def test_malformed_rows_are_skipped():
+    rows = ROWS + [
+        {**_row(5, "v3", 0, "ARR"), "end_sec": None},
+        {"id": 6, "video_id": "v3", "start_sec": 0, "end_sec": 30},
+    ]
+    index = BM25Index.from_rows(rows)
+    assert len(index) == 4
+
+
+def test_chunk_key_keeps_fractional_start():
+    a = {"video_id": "v1", "start_sec": 10.2}
+    b = {"video_id": "v1", "start_sec": 10.7}
+    assert chunk_key(a) != chunk_key(b)
+    assert chunk_key({**a, "id": 7}) == 7
+    assert chunk_key({**a, "id": 7}, by_id=False) == ("v1", 10.2)
+
+
+def test_rrf_ordering_and_weights():
+    a, b, c = ROWS[0], ROWS[1], ROWS[2]
+    fused = reciprocal_rank_fusion([([a, b], 1.0), ([b, c], 1.0)], k=60)
+    assert [key for key, _ in fused] == [2, 1, 3]
+    assert fused[0][1] == pytest.approx(1 / 62 + 1 / 61)
+
+    # a heavier second list pulls its top hit above the first list's
+    fused = reciprocal_rank_fusion([([a, b], 1.0), ([c], 3.0)], k=60)
+    assert fused[0][0] == 3
+
+    # zero weight drops a list entirely
+    fused = reciprocal_rank_fusion([([a], 1.0), ([c], 0.0)], k=60)
+    assert [key for key, _ in fused] == [1]
@@ -0,0 +1,66 @@
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("dotenv")
+
+from app.services.lexical_index import BM25Index  # noqa: E402
+from app.services.rag_service import retrieve_contexts  # noqa: E402
+
+
+class FakeEmbeddingModel:
+    def get_embeddings(self, texts):
+        return [SimpleNamespace(values=[0.0, 1.0])]
+
+
+class FakeSupabase:
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = []
+
+    def rpc(self, fn, params):
+        self.calls.append(params)
+        return SimpleNamespace(execute=lambda: SimpleNamespace(data=self.rows[: params["match_count"]]))
+
+
+VECTOR_ROWS = [
+    {"id": 1, "video_id": "v1", "title": None, "start_sec": 0, "end_sec": 30,
+     "text": "how to think about fundraising", "similarity": 0.9},
+    {"id": 2, "video_id": "v1", "title": None, "start_sec": 30, "end_sec": 60,
+     "text": "talk to your users", "similarity": 0.8},
+]
+LEXICAL_ROWS = VECTOR_ROWS + [
+    {"id": 3, "video_id": "v2", "title": None, "start_sec": 0, "end_sec": 30,
+     "text": "ARR ARR ARR seed round"},
+]
+
+
+def _retrieve(**kwargs):
+    return retrieve_contexts(
+        supabase=FakeSupabase(VECTOR_ROWS),
+        embedding_model=FakeEmbeddingModel(),
+        query="ARR seed round",
+        top_k=2,
+        **kwargs,
+    )
+
+
+def test_lexical_weight_zero_is_vector_only():
+    out = _retrieve(lexical_index=BM25Index.from_rows(LEXICAL_ROWS), lexical_weight=0)
+    assert out["mode"] == "vector"
+    assert [c["video_id"] for c in out["contexts"]] == ["v1", "v1"]
+    assert all(c["bm25_score"] is None and c["rrf_score"] is None for c in out["contexts"])
+
+
+def test_missing_index_is_vector_only():
+    out = _retrieve(lexical_index=None)
+    assert out["mode"] == "vector"
+    assert set(out["contexts"][0]) >= {"similarity", "bm25_score", "rrf_score"}
+
+
+def test_hybrid_surfaces_lexical_hit():
+    out = _retrieve(lexical_index=BM25Index.from_rows(LEXICAL_ROWS), lexical_weight=2.0)
+    assert out["mode"] == "hybrid"
+    assert out["contexts"][0]["video_id"] == "v2"
+    assert out["contexts"][0]["similarity"] is None
+    assert out["contexts"][0]["rrf_score"] is not None